@@ -163,6 +163,8 @@ cdef class _Flattening:
         double start_t,
         double end_t
     ):
+        if self._recursion_error:
+            return  # stop subdividing all pending segments
         if self._recursion_level > RECURSION_LIMIT:
             self._recursion_error = 1
             return
@@ -182,6 +182,8 @@ cdef class _Flattening:
     ):
         # Keep in sync with CPython implementation: ezdxf/math/_bezier4p.py
         # Test suite: 630a
+        if self._recursion_error:
+            return  # stop subdividing all pending segments
         if self._recursion_level > RECURSION_LIMIT:
             self._recursion_error = 1
             return
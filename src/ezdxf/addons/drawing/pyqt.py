@@ -1,7 +1,8 @@
 # Copyright (c) 2020-2022, Matthew Broadway
 # License: MIT License
 import math
-from typing import Optional, Iterable, Dict, Tuple, List
+from contextlib import contextmanager
+from typing import Optional, Iterable, Iterator, Dict, Tuple, List
 from ezdxf.addons.xqt import QtCore as qc, QtGui as qg, QtWidgets as qw
 
 from ezdxf.addons.drawing.backend import Backend, prepare_string_for_rendering
@@ -10,11 +11,16 @@ from ezdxf.tools.fonts import FontMeasurements
 from ezdxf.addons.drawing.type_hints import Color
 from ezdxf.addons.drawing.properties import Properties
 from ezdxf.addons.drawing.qt_text_renderer import QtTextRenderer
+from ezdxf.entities import DXFGraphic
 from ezdxf.tools import fonts
 from ezdxf.math import Vec3, Matrix44
 from ezdxf.path import Path, to_qpainter_path
 
 PatternKey = Tuple[str, float]
+ZERO_LENGTH_TOL = 1e-9
+# Shared by all items and backends, do not modify!
+_NO_PEN = qg.QPen(qc.Qt.NoPen)
+_NO_BRUSH = qg.QBrush(qc.Qt.NoBrush)
 
 
 class _Point(qw.QAbstractGraphicsShapeItem):
@@ -26,7 +32,7 @@ class _Point(qw.QAbstractGraphicsShapeItem):
         super().__init__()
         self.location = qc.QPointF(x, y)
         self.radius = 1.0
-        self.setPen(qg.QPen(qc.Qt.NoPen))
+        self.setPen(_NO_PEN)
         self.setBrush(brush)
 
     def paint(
@@ -36,6 +42,8 @@ class _Point(qw.QAbstractGraphicsShapeItem):
         widget: Optional[qw.QWidget] = None,
     ) -> None:
         view_scale = _get_x_scale(painter.transform())
+        if view_scale == 0.0:  # degenerated view transformation
+            return
         radius = self.radius / view_scale
         painter.setBrush(self.brush())
         painter.setPen(qc.Qt.NoPen)
@@ -45,6 +53,39 @@ class _Point(qw.QAbstractGraphicsShapeItem):
         return qc.QRectF(self.location, qc.QSizeF(1, 1))
 
 
+class _Points(qw.QAbstractGraphicsShapeItem):
+    """Multiple dimensionless points of the same DXF entity, which are drawn
+    'cosmetically' (scale depends on view) by a single
+    :meth:`QPainter.drawPoints` call.
+    """
+
+    def __init__(self, locations: List[qc.QPointF], brush: qg.QBrush):
+        super().__init__()
+        self.locations = qg.QPolygonF(locations)
+        self.radius = 1.0
+        # bounding rect of all points, see _Point.boundingRect()
+        self._bounding_rect = self.locations.boundingRect().adjusted(0, 0, 1, 1)
+        self.setPen(_NO_PEN)
+        self.setBrush(brush)
+        # A cosmetic pen with round caps draws each point as a filled circle
+        # with a constant diameter in pixels:
+        self._point_pen = qg.QPen(brush.color(), self.radius * 2.0)
+        self._point_pen.setCosmetic(True)
+        self._point_pen.setCapStyle(qc.Qt.RoundCap)
+
+    def paint(
+        self,
+        painter: qg.QPainter,
+        option: qw.QStyleOptionGraphicsItem,
+        widget: Optional[qw.QWidget] = None,
+    ) -> None:
+        painter.setPen(self._point_pen)
+        painter.drawPoints(self.locations)
+
+    def boundingRect(self) -> qc.QRectF:
+        return self._bounding_rect
+
+
 class ViewportGroup(qw.QGraphicsItemGroup):
     def __init__(self, clipping_path: Path):
         super().__init__()
@@ -70,39 +111,115 @@ class PyQtBackend(Backend):
         use_text_cache: bool = True,
         debug_draw_rect: bool = False,
         extra_lineweight_scaling: float = 2.0,
+        bsp_index: bool = True,
     ):
         """
         Args:
             extra_lineweight_scaling: compared to other backends,
                 PyQt draws lines which appear thinner
+            bsp_index: ``False`` to disable the BSP item index of the scene,
+                adding items to a scene without index is faster for very large
+                DXF documents, but locating items e.g. by mouse position is
+                slower
         """
         super().__init__()
+        self._bsp_index = bsp_index
         self._scene = scene or qw.QGraphicsScene()  # avoids many type errors
+        self._set_item_index_method()
         self._color_cache: Dict[Color, qg.QColor] = {}
         self._pattern_cache: Dict[PatternKey, int] = {}
-        self._no_line = qg.QPen(qc.Qt.NoPen)
-        self._no_fill = qg.QBrush(qc.Qt.NoBrush)
+        self._pen_cache: Dict[Tuple[Color, float], qg.QPen] = {}
+        self._brush_cache: Dict[Color, qg.QBrush] = {}
+        self._no_line = _NO_PEN
+        self._no_fill = _NO_BRUSH
 
         self._text_renderer = QtTextRenderer(use_cache=use_text_cache)
         self._extra_lineweight_scaling = extra_lineweight_scaling
+        self._lineweight_to_px = 1.0  # set by configure()
         self._debug_draw_rect = debug_draw_rect
         self._current_viewport: Optional[ViewportGroup] = None
+        # cached parent entities of the current entity, see _set_item_data()
+        self._parent_stack: Optional[Tuple[DXFGraphic, ...]] = None
+        # items to add to the scene at the end of a batch() context
+        self._pending_items: Optional[List[qw.QGraphicsItem]] = None
 
     def configure(self, config: Configuration) -> None:
         if config.min_lineweight is None:
             config = config.with_changes(min_lineweight=0.24)
         super().configure(config)
+        # lineweight in mm to pen width in pixels:
+        self._lineweight_to_px = (
+            config.lineweight_scaling * self._extra_lineweight_scaling / 0.3527
+        )
+        self._pen_cache.clear()
 
     def set_scene(self, scene: qw.QGraphicsScene):
         self._scene = scene
+        self._set_item_index_method()
+
+    def _set_item_index_method(self) -> None:
+        if not self._bsp_index:
+            self._scene.setItemIndexMethod(qw.QGraphicsScene.NoIndex)
+
+    @staticmethod
+    def configure_view(view: qw.QGraphicsView) -> None:
+        """Setup a :class:`QGraphicsView` for scenes with many small items,
+        repainting the whole viewport at once is faster than updating many
+        small regions.
+        """
+        view.setViewportUpdateMode(qw.QGraphicsView.FullViewportUpdate)
 
     def clear_text_cache(self):
         self._text_renderer.clear_cache()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager to defer adding graphic items to the scene until
+        the end of the context, where all items are added at once without
+        maintaining the scene index and emitting scene signals for each item.
+        Calling :meth:`finalize` inside the context adds the pending items
+        to the scene first::
+
+            with backend.batch():
+                Frontend(ctx, backend).draw_layout(msp)
+
+        Raises:
+            RuntimeError: for nested :meth:`batch` calls
+
+        """
+        if self._pending_items is not None:
+            raise RuntimeError("nested batch() calls are not supported")
+        self._pending_items = []
+        try:
+            yield
+        finally:
+            try:
+                self._flush_pending_items()
+            finally:
+                self._pending_items = None
+
+    def _flush_pending_items(self) -> None:
+        pending = self._pending_items
+        if not pending:
+            return
+        scene = self._scene
+        index_method = scene.itemIndexMethod()
+        scene.setItemIndexMethod(qw.QGraphicsScene.NoIndex)
+        signals_blocked = scene.blockSignals(True)
+        try:
+            for item in pending:
+                scene.addItem(item)
+        finally:
+            pending.clear()
+            scene.blockSignals(signals_blocked)
+            # rebuilds the scene index at once
+            scene.setItemIndexMethod(index_method)
+        scene.update()
+
     def set_clipping_path(self, path: Path = None, scale: float = 1.0) -> bool:
         if path:
             self._current_viewport = ViewportGroup(path)
-            self._scene.addItem(self._current_viewport)
+            self._add_to_scene(self._current_viewport)
         else:
             self._current_viewport = None
         return True  # confirm clipping support
@@ -112,17 +229,32 @@ class PyQtBackend(Backend):
         if self._current_viewport:
             self._current_viewport.addToGroup(item)
         else:
+            self._add_to_scene(item)
+
+    def _add_to_scene(self, item: qw.QGraphicsItem) -> None:
+        pending = self._pending_items
+        if pending is None:
             self._scene.addItem(item)
+        else:
+            pending.append(item)
 
     def _get_color(self, color: Color) -> qg.QColor:
         qt_color = self._color_cache.get(color, None)
         if qt_color is None:
-            if len(color) == 7:
-                qt_color = qg.QColor(color)  # '#RRGGBB'
-            elif len(color) == 9:
-                rgb = color[1:7]
-                alpha = color[7:9]
-                qt_color = qg.QColor(f"#{alpha}{rgb}")  # '#AARRGGBB'
+            # avoid parsing the color string by Qt
+            if len(color) == 7:  # '#RRGGBB'
+                qt_color = qg.QColor(
+                    int(color[1:3], 16),
+                    int(color[3:5], 16),
+                    int(color[5:7], 16),
+                )
+            elif len(color) == 9:  # '#RRGGBBAA'
+                qt_color = qg.QColor(
+                    int(color[1:3], 16),
+                    int(color[3:5], 16),
+                    int(color[5:7], 16),
+                    int(color[7:9], 16),
+                )
             else:
                 raise TypeError(color)
 
@@ -133,49 +265,67 @@ class PyQtBackend(Backend):
         """Returns a cosmetic pen with applied lineweight but without line type
         support.
         """
-        px = (
-            properties.lineweight
-            / 0.3527
-            * self.config.lineweight_scaling
-            * self._extra_lineweight_scaling
-        )
-        pen = qg.QPen(self._get_color(properties.color), px)
-        # Use constant width in pixel:
-        pen.setCosmetic(True)
-        pen.setJoinStyle(qc.Qt.RoundJoin)
+        key = (properties.color, properties.lineweight)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            px = properties.lineweight * self._lineweight_to_px
+            pen = qg.QPen(self._get_color(properties.color), px)
+            # Use constant width in pixel:
+            pen.setCosmetic(True)
+            pen.setJoinStyle(qc.Qt.RoundJoin)
+            self._pen_cache[key] = pen
         return pen
 
     def _get_brush(self, properties: Properties) -> qg.QBrush:
         # Hatch patterns are handled by the frontend since v0.18.1
         filling = properties.filling
         if filling:
-            return qg.QBrush(self._get_color(properties.color), qc.Qt.SolidPattern)  # type: ignore
+            return self._get_solid_brush(properties.color)
         return self._no_fill
 
+    def _get_solid_brush(self, color: Color) -> qg.QBrush:
+        brush = self._brush_cache.get(color)
+        if brush is None:
+            brush = qg.QBrush(self._get_color(color), qc.Qt.SolidPattern)  # type: ignore
+            self._brush_cache[color] = brush
+        return brush
+
+    def enter_entity(self, entity: DXFGraphic, properties: Properties) -> None:
+        super().enter_entity(entity, properties)
+        self._parent_stack = None
+
+    def exit_entity(self, entity: DXFGraphic) -> None:
+        super().exit_entity(entity)
+        self._parent_stack = None
+
     def _set_item_data(self, item: qw.QGraphicsItem) -> None:
-        parent_stack = tuple(e for e, props in self.entity_stack[:-1])
+        parent_stack = self._parent_stack
+        if parent_stack is None:  # rebuild only if the entity stack changed
+            parent_stack = tuple(e for e, props in self.entity_stack[:-1])
+            self._parent_stack = parent_stack
         current_entity = self.current_entity
-        if isinstance(item, list):
-            for item_ in item:
-                item_.setData(CorrespondingDXFEntity, current_entity)
-                item_.setData(CorrespondingDXFParentStack, parent_stack)
-        else:
-            item.setData(CorrespondingDXFEntity, current_entity)
-            item.setData(CorrespondingDXFParentStack, parent_stack)
+        items = item if isinstance(item, list) else (item,)
+        for item_ in items:
+            item_.setData(CorrespondingDXFEntity, current_entity)
+            item_.setData(CorrespondingDXFParentStack, parent_stack)
 
     def set_background(self, color: Color):
         self._scene.setBackgroundBrush(qg.QBrush(self._get_color(color)))
 
     def draw_point(self, pos: Vec3, properties: Properties) -> None:
         """Draw a real dimensionless point."""
-        brush = qg.QBrush(self._get_color(properties.color), qc.Qt.SolidPattern)
+        brush = self._get_solid_brush(properties.color)
         item = _Point(pos.x, pos.y, brush)
-        self._set_item_data(item)
         self._add_item(item)
 
     def draw_line(self, start: Vec3, end: Vec3, properties: Properties) -> None:
-        # PyQt draws a long line for a zero-length line:
-        if start.isclose(end):
+        # PyQt draws a long line for a zero-length line, the view is 2D, only
+        # x- and y-axis are relevant for the zero-length check, same as for
+        # draw_solid_lines():
+        if (
+            abs(start.x - end.x) <= ZERO_LENGTH_TOL
+            and abs(start.y - end.y) <= ZERO_LENGTH_TOL
+        ):
             self.draw_point(start, properties)
         else:
             item = qw.QGraphicsLineItem(start.x, start.y, end.x, end.y)
@@ -187,16 +337,43 @@ class PyQtBackend(Backend):
         lines: Iterable[Tuple[Vec3, Vec3]],
         properties: Properties,
     ):
-        """Fast method to draw a bunch of solid lines with the same properties."""
-        pen = self._get_pen(properties)
-        add_line = self._add_item
+        """Fast method to draw a bunch of solid lines with the same properties.
+
+        All lines are collected into a single :class:`QGraphicsPathItem`,
+        which requires only one scene insertion instead of one for each line.
+        """
+        qpath = qg.QPainterPath()
+        points: List[Vec3] = []
+        move_to = qpath.moveTo
+        line_to = qpath.lineTo
+        add_point = points.append
         for s, e in lines:
-            if s.isclose(e):
-                self.draw_point(s, properties)
+            sx = s.x
+            sy = s.y
+            ex = e.x
+            ey = e.y
+            # The view is 2D, only x- and y-axis are relevant for the
+            # zero-length check:
+            if (
+                abs(sx - ex) <= ZERO_LENGTH_TOL
+                and abs(sy - ey) <= ZERO_LENGTH_TOL
+            ):
+                # PyQt draws a long line for a zero-length line:
+                add_point(s)
             else:
-                item = qw.QGraphicsLineItem(s.x, s.y, e.x, e.y)
-                item.setPen(pen)
-                add_line(item)
+                move_to(sx, sy)
+                line_to(ex, ey)
+        if not qpath.isEmpty():
+            item = qw.QGraphicsPathItem(qpath)
+            item.setPen(self._get_pen(properties))
+            item.setBrush(self._no_fill)
+            self._add_item(item)
+        if points:
+            item = _Points(
+                [qc.QPointF(p.x, p.y) for p in points],
+                self._get_solid_brush(properties.color),
+            )
+            self._add_item(item)
 
     def draw_path(self, path: Path, properties: Properties) -> None:
         item = qw.QGraphicsPathItem(to_qpainter_path([path]))
@@ -210,16 +387,20 @@ class PyQtBackend(Backend):
         holes: Iterable[Path],
         properties: Properties,
     ) -> None:
+        # The paths are not modified by to_qpainter_path(), therefore only
+        # paths with wrong orientation are copied, by reversing them:
         oriented_paths: List[Path] = []
         for path in paths:
             try:
-                path = path.counter_clockwise()
+                if path.has_clockwise_orientation():
+                    path = path.reversed()
             except ValueError:  # cannot detect path orientation
                 continue
             oriented_paths.append(path)
         for path in holes:
             try:
-                path = path.clockwise()
+                if not path.has_clockwise_orientation():
+                    path = path.reversed()
             except ValueError:  # cannot detect path orientation
                 continue
             oriented_paths.append(path)
@@ -232,9 +413,7 @@ class PyQtBackend(Backend):
         self, points: Iterable[Vec3], properties: Properties
     ) -> None:
         brush = self._get_brush(properties)
-        polygon = qg.QPolygonF()
-        for p in points:
-            polygon.append(qc.QPointF(p.x, p.y))
+        polygon = qg.QPolygonF([qc.QPointF(p.x, p.y) for p in points])
         item = _CosmeticPolygon(polygon)
         item.setPen(self._no_line)
         item.setBrush(brush)
@@ -257,8 +436,7 @@ class PyQtBackend(Backend):
         path = self._text_renderer.get_text_path(text, qfont)
         path = _matrix_to_qtransform(transform).map(path)
         item = qw.QGraphicsPathItem(path)
-        brush = qg.QBrush(self._get_color(properties.color), qc.Qt.SolidPattern)
-        item.setBrush(brush)
+        item.setBrush(self._get_solid_brush(properties.color))
         item.setPen(self._no_line)
         self._add_item(item)
 
@@ -287,9 +465,13 @@ class PyQtBackend(Backend):
 
     def clear(self) -> None:
         self._scene.clear()
+        if self._pending_items is not None:
+            self._pending_items.clear()
 
     def finalize(self) -> None:
         super().finalize()
+        # the scene rect requires all items of a batch() context:
+        self._flush_pending_items()
         self._scene.setSceneRect(self._scene.itemsBoundingRect())
         if self._debug_draw_rect:
             properties = Properties()
@@ -334,8 +516,21 @@ def _set_cosmetic_brush(
     item.setBrush(brush)
 
 
+# Painting is done in the GUI thread, a thread-local storage is not required.
+_last_x_scale: List = [None, 1.0]  # [(m11, m21), x-scale]
+
+
 def _get_x_scale(t: qg.QTransform) -> float:
-    return math.sqrt(t.m11() * t.m11() + t.m21() * t.m21())
+    # All items of a paint event are painted with the same view transformation:
+    key = (t.m11(), t.m21())
+    last = _last_x_scale
+    if last[0] == key:
+        return last[1]
+    m11, m21 = key
+    scale = math.sqrt(m11 * m11 + m21 * m21)
+    last[0] = key
+    last[1] = scale
+    return scale
 
 
 def _matrix_to_qtransform(matrix: Matrix44) -> qg.QTransform:
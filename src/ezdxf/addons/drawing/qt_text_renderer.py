@@ -1,12 +1,16 @@
 # Copyright (c) 2020-2022, Matthew Broadway
 # License: MIT License
-from typing import Dict, Optional, Union
-from collections import defaultdict
+from typing import Dict, Optional, Tuple, Union
 from functools import lru_cache
 from .text_renderer import TextRenderer
 from ezdxf.addons.xqt import QtCore as qc, QtGui as qg
 from ezdxf.math import Matrix44
-from ezdxf.tools.fonts import FontMeasurements, FontFace, weight_name_to_value
+from ezdxf.tools.fonts import (
+    FontMeasurements,
+    FontFace,
+    weight_name_to_value,
+    WEIGHT_TO_VALUE,
+)
 import ezdxf.path
 
 
@@ -15,11 +19,13 @@ class QtTextRenderer(TextRenderer[qg.QFont]):
         self._default_font = font
         self._use_cache = use_cache
 
-        # Each font has its own text path cache
-        # key is QFont.key()
+        # Text path cache, key is (QFont.key(), text)
         self._text_path_cache: Dict[
-            str, Dict[str, qg.QPainterPath]
-        ] = defaultdict(dict)
+            Tuple[Optional[str], str], qg.QPainterPath
+        ] = {}
+
+        # Text rect cache, key is (QFont.key(), text)
+        self._text_rect_cache: Dict[Tuple[Optional[str], str], qc.QRectF] = {}
 
         # Each font has its own font measurements cache
         # key is QFont.key()
@@ -31,6 +37,7 @@ class QtTextRenderer(TextRenderer[qg.QFont]):
 
     def clear_cache(self):
         self._text_path_cache.clear()
+        self._text_rect_cache.clear()
 
     def get_scale(self, desired_cap_height: float, font: qg.QFont) -> float:
         measurements = self.get_font_measurements(font)
@@ -64,21 +71,31 @@ class QtTextRenderer(TextRenderer[qg.QFont]):
 
     def get_text_path(self, text: str, font: qg.QFont) -> qg.QPainterPath:
         # None is the default font
-        key = font.key() if font is not None else None
-        cache = self._text_path_cache[key]  # defaultdict(dict)
-        path = cache.get(text, None)
+        key = (font.key() if font is not None else None, text)
+        path = self._text_path_cache.get(key, None)
         if path is None:
             if font is None:
                 font = self._default_font
             path = qg.QPainterPath()
+            reserve = getattr(path, "reserve", None)  # requires Qt 5.13
+            if reserve is not None:
+                # avoid incremental growth of the element buffer:
+                reserve(max(16, len(text) * 8))
             path.addText(0, 0, font, text)
             if self._use_cache:
-                cache[text] = path
+                self._text_path_cache[key] = path
         return path
 
     def get_text_rect(self, text: str, font: qg.QFont) -> qc.QRectF:
-        # no point caching the bounding rect calculation, it is very cheap
-        return self.get_text_path(text, font).boundingRect()
+        # None is the default font
+        key = (font.key() if font is not None else None, text)
+        rect = self._text_rect_cache.get(key, None)
+        if rect is None:
+            # boundingRect() has to process all elements of the text path
+            rect = self.get_text_path(text, font).boundingRect()
+            if self._use_cache:
+                self._text_rect_cache[key] = rect
+        return rect
 
     def get_text_line_width(
         self, text: str, cap_height: float, font: FontFace = None
@@ -122,11 +139,23 @@ def _get_font(font: FontFace) -> Optional[qg.QFont]:
 # QFont::Black	87	87
 def _map_weight(weight: Union[str, int]) -> int:
     if isinstance(weight, str):
-        weight = weight_name_to_value(weight)
+        # unknown weight names are mapped to "normal"
+        return _QT_WEIGHT_BY_NAME.get(weight.lower(), _QT_WEIGHT_NORMAL)
+    return _map_weight_value(weight)
+
+
+def _map_weight_value(weight: int) -> int:
     value = int((weight / 10) + 10)  # normal: 400 -> 50
     return min(max(0, value), 99)
 
 
+_QT_WEIGHT_NORMAL = _map_weight_value(weight_name_to_value("normal"))
+_QT_WEIGHT_BY_NAME: Dict[str, int] = {
+    name.lower(): _map_weight_value(weight_name_to_value(name))
+    for name in WEIGHT_TO_VALUE
+}
+
+
 # https://doc.qt.io/qt-5/qfont.html#Stretch-enum
 StretchMapping = {
     "ultracondensed": 50,
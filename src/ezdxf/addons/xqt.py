@@ -36,6 +36,7 @@ if TRY_PYSIDE6:
             QAction,
             QColor,
             QPainterPath,
+            QPolygonF,
             QStandardItem,
             QStandardItemModel,
         )
@@ -73,6 +74,7 @@ if TRY_PYQT5 and not PYSIDE6:
         from PyQt5.QtGui import (
             QColor,
             QPainterPath,
+            QPolygonF,
             QStandardItem,
             QStandardItemModel,
         )
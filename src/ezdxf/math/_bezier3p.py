@@ -1,8 +1,9 @@
 # Copyright (c) 2021-2022 Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Iterable, Sequence, Type, Optional, TYPE_CHECKING
+from typing import Iterable, Sequence, Type, Optional, Tuple, TYPE_CHECKING
 import math
+from functools import lru_cache
 
 # The pure Python implementation can't import from ._ctypes or ezdxf.math!
 from ._vector import Vec3, Vec2
@@ -13,12 +14,32 @@ if TYPE_CHECKING:
 
 __all__ = ["Bezier3P"]
 
+# Same subdivision limit as the Cython implementation:
+RECURSION_LIMIT = 1000
+
 
 def check_if_in_valid_range(t: float) -> None:
     if not (0 <= t <= 1.0):
         raise ValueError("t not in range [0 to 1]")
 
 
+# Optimization:
+# quadratic P(t) = (1-t)^2*P0 + 2*(1-t)*t*P1 + t^2*P2
+# quadratic P(t) = a*P0 + b*P1 + c*P2
+# P0 is always (0, 0, 0) => a*P0 is not required
+@lru_cache(maxsize=64)
+def bernstein2_table(segments: int) -> Sequence[Tuple[float, float]]:
+    """Returns the Bernstein weights (b, c) of the inner curve points for an
+    uniform approximation by `segments`.
+    """
+    delta_t = 1.0 / segments
+    table = []
+    for segment in range(1, segments):
+        t = delta_t * segment
+        table.append((2.0 * t * (1.0 - t), t * t))
+    return tuple(table)
+
+
 class Bezier3P:
     """Implements an optimized quadratic `Bézier curve`_ for exact 3 control
     points.
@@ -91,12 +112,14 @@ class Bezier3P:
         """
         if segments < 1:
             raise ValueError(segments)
-        delta_t: float = 1.0 / segments
-        cp = self.control_points
-        yield cp[0]
-        for segment in range(1, segments):
-            yield self._get_curve_point(delta_t * segment)
-        yield cp[2]
+        # 1st control point (p0) is always (0, 0, 0)
+        p0, p1, p2 = self._control_points
+        offset = self._offset
+        yield offset
+        for b, c in bernstein2_table(segments):
+            # add offset at last - it is maybe very large
+            yield p1 * b + p2 * c + offset
+        yield p2 + offset
 
     def approximated_length(self, segments: int = 128) -> float:
         """Returns estimated length of Bèzier-curve as approximation by line
@@ -132,17 +155,31 @@ class Bezier3P:
             start_t: float,
             end_t: float,
         ) -> Iterable["AnyVec"]:
-            mid_t: float = (start_t + end_t) * 0.5
-            mid_point: "AnyVec" = self._get_curve_point(mid_t)
-            chk_point: "AnyVec" = start_point.lerp(end_point)
-            # center point point is faster than projecting mid point onto
-            # vector start -> end:
-            d = chk_point.distance(mid_point)
-            if d < distance:
-                yield end_point
-            else:
-                yield from subdiv(start_point, mid_point, start_t, mid_t)
-                yield from subdiv(mid_point, end_point, mid_t, end_t)
+            # Iterative subdivision by an explicit stack, yields the same
+            # vertices in the same order as a recursive implementation:
+            stack = [(start_point, end_point, start_t, end_t, 0)]
+            push = stack.append
+            pop = stack.pop
+            while stack:
+                start_point, end_point, start_t, end_t, level = pop()
+                if level > RECURSION_LIMIT:
+                    raise RecursionError(
+                        "Bezier3P flattening error, "
+                        "check for very large coordinates"
+                    )
+                mid_t: float = (start_t + end_t) * 0.5
+                mid_point: "AnyVec" = self._get_curve_point(mid_t)
+                chk_point: "AnyVec" = start_point.lerp(end_point)
+                # center point point is faster than projecting mid point onto
+                # vector start -> end:
+                d = chk_point.distance(mid_point)
+                if d < distance:
+                    yield end_point
+                else:
+                    # push the 2nd half first, the 1st half is processed next
+                    level += 1
+                    push((mid_point, end_point, mid_t, end_t, level))
+                    push((start_point, mid_point, start_t, mid_t, level))
 
         dt: float = 1.0 / segments
         t0: float = 0.0
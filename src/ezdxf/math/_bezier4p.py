@@ -21,6 +21,9 @@ __all__ = [
     "cubic_bezier_from_ellipse",
 ]
 
+# Same subdivision limit as the Cython implementation:
+RECURSION_LIMIT = 1000
+
 
 # Optimization:
 # cubic P(t) = (1-t)^3*P0 + 3*(1-t)^2*t*P1 + 3*(1-t)*t^2*P2 + t^3*P3
@@ -127,12 +130,28 @@ class Bezier4P:
         """
         if segments < 1:
             raise ValueError(segments)
-        delta_t = 1.0 / segments
-        cp = self.control_points
-        yield cp[0]
-        for segment in range(1, segments):
-            yield self._get_curve_point(delta_t * segment)
-        yield cp[3]
+        # Forward differencing: each new curve point requires just three
+        # vector additions instead of evaluating the Bernstein polynom.
+        # 1st control point (p0) is always (0, 0, 0)
+        p0, p1, p2, p3 = self._control_points
+        offset = self._offset
+        f = float(segments)
+        rt1 = p1 * (3.0 / f)
+        f *= segments
+        rt2 = (p2 - p1 * 2.0) * (3.0 / f)
+        f *= segments
+        rt3 = (p3 + (p1 - p2) * 3.0) * (1.0 / f)
+        q0 = p0
+        q1 = rt1 + rt2 + rt3
+        q2 = rt2 * 2.0 + rt3 * 6.0
+        q3 = rt3 * 6.0
+        yield offset
+        for _ in range(1, segments):
+            q0 += q1
+            q1 += q2
+            q2 += q3
+            yield q0 + offset
+        yield p3 + offset  # exact end point
 
     def flattening(
         self, distance: float, segments: int = 4
@@ -159,17 +178,31 @@ class Bezier4P:
             start_t: float,
             end_t: float,
         ) -> Iterable[AnyVec]:
-            mid_t: float = (start_t + end_t) * 0.5
-            mid_point: AnyVec = self._get_curve_point(mid_t)
-            chk_point: AnyVec = start_point.lerp(end_point)
-            # center point point is faster than projecting mid point onto
-            # vector start -> end:
-            d = chk_point.distance(mid_point)
-            if d < distance:
-                yield end_point
-            else:
-                yield from subdiv(start_point, mid_point, start_t, mid_t)
-                yield from subdiv(mid_point, end_point, mid_t, end_t)
+            # Iterative subdivision by an explicit stack, yields the same
+            # vertices in the same order as a recursive implementation:
+            stack = [(start_point, end_point, start_t, end_t, 0)]
+            push = stack.append
+            pop = stack.pop
+            while stack:
+                start_point, end_point, start_t, end_t, level = pop()
+                if level > RECURSION_LIMIT:
+                    raise RecursionError(
+                        "Bezier4P flattening error, "
+                        "check for very large coordinates"
+                    )
+                mid_t: float = (start_t + end_t) * 0.5
+                mid_point: AnyVec = self._get_curve_point(mid_t)
+                chk_point: AnyVec = start_point.lerp(end_point)
+                # center point point is faster than projecting mid point onto
+                # vector start -> end:
+                d = chk_point.distance(mid_point)
+                if d < distance:
+                    yield end_point
+                else:
+                    # push the 2nd half first, the 1st half is processed next
+                    level += 1
+                    push((mid_point, end_point, mid_t, end_t, level))
+                    push((start_point, mid_point, start_t, mid_t, level))
 
         dt: float = 1.0 / segments
         t0: float = 0.0
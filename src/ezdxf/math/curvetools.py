@@ -17,8 +17,11 @@ from ezdxf.math.linalg import cubic_equation
 
 __all__ = [
     "bezier_to_bspline",
+    "control_points_to_bspline",
     "quadratic_to_cubic_bezier",
+    "quadratic_to_cubic_control_points",
     "have_bezier_curves_g1_continuity",
+    "have_control_points_g1_continuity",
     "AnyBezier",
     "reverse_bezier_curves",
     "split_bezier",
@@ -42,10 +45,20 @@ def quadratic_to_cubic_bezier(curve: Bezier3P) -> Bezier4P:
     .. versionadded:: 0.16
 
     """
-    start, control, end = curve.control_points
+    return Bezier4P(quadratic_to_cubic_control_points(curve.control_points))
+
+
+def quadratic_to_cubic_control_points(points: Sequence[T]) -> Tuple[T, T, T, T]:
+    """Convert the control points of a quadratic Bèzier curve into the control
+    points of a cubic Bèzier curve.
+
+    .. versionadded:: 1.0
+
+    """
+    start, control, end = points
     control_1 = start + 2 * (control - start) / 3
     control_2 = end + 2 * (control - end) / 3
-    return Bezier4P((start, control_1, control_2, end))
+    return start, control_1, control_2, end
 
 
 def bezier_to_bspline(curves: Iterable[AnyBezier]) -> BSpline:
@@ -59,13 +72,23 @@ def bezier_to_bspline(curves: Iterable[AnyBezier]) -> BSpline:
 
     .. versionadded:: 0.16
 
+    """
+    return control_points_to_bspline(c.control_points for c in curves)
+
+
+def control_points_to_bspline(curves: Iterable[Sequence[AnyVec]]) -> BSpline:
+    """Convert the control points of multiple quadratic or cubic Bèzier curves
+    into a single cubic B-spline, same as :func:`bezier_to_bspline` but without
+    the need to create Bèzier curve objects.
+
+    .. versionadded:: 1.0
+
     """
 
     # Source: https://math.stackexchange.com/questions/2960974/convert-continuous-bezier-curve-to-b-spline
-    def get_points(bezier: AnyBezier):
-        points = bezier.control_points
+    def get_points(points: Sequence[AnyVec]):
         if len(points) < 4:
-            return quadratic_to_cubic_bezier(bezier).control_points
+            return quadratic_to_cubic_control_points(points)
         else:
             return points
 
@@ -93,19 +116,32 @@ def have_bezier_curves_g1_continuity(
     .. versionadded:: 0.16
 
     """
-    b1_pnts = tuple(b1.control_points)
-    b2_pnts = tuple(b2.control_points)
+    return have_control_points_g1_continuity(
+        tuple(b1.control_points), tuple(b2.control_points), g1_tol
+    )
+
 
-    if not b1_pnts[-1].isclose(b2_pnts[0]):
+def have_control_points_g1_continuity(
+    cp1: Sequence[AnyVec], cp2: Sequence[AnyVec], g1_tol: float = 1e-4
+) -> bool:
+    """Return ``True`` if the adjacent quadratic or cubic Bèzier curves defined
+    by the control points `cp1` and `cp2` have G1 continuity, same as
+    :func:`have_bezier_curves_g1_continuity` but without the need to create
+    Bèzier curve objects.
+
+    .. versionadded:: 1.0
+
+    """
+    if not cp1[-1].isclose(cp2[0]):
         return False  # start- and end point are not close enough
 
     try:
-        te = (b1_pnts[-1] - b1_pnts[-2]).normalize()
+        te = (cp1[-1] - cp1[-2]).normalize()
     except ZeroDivisionError:
         return False  # tangent calculation not possible
 
     try:
-        ts = (b2_pnts[1] - b2_pnts[0]).normalize()
+        ts = (cp2[1] - cp2[0]).normalize()
     except ZeroDivisionError:
         return False  # tangent calculation not possible
 
@@ -12,9 +12,12 @@ from typing import (
     Callable,
     Type,
     TypeVar,
+    Sequence,
 )
-from functools import singledispatch, partial
+from functools import singledispatch, partial, lru_cache
+from contextlib import contextmanager
 import enum
+import math
 from ezdxf.math import (
     ABS_TOL,
     Vec2,
@@ -26,10 +29,11 @@ from ezdxf.math import (
     Bezier4P,
     ConstructionEllipse,
     BSpline,
-    have_bezier_curves_g1_continuity,
     fit_points_to_cad_cv,
     UVec,
     Matrix44,
+    control_points_to_bspline,
+    have_control_points_g1_continuity,
 )
 from ezdxf.lldxf import const
 from ezdxf.entities import (
@@ -59,13 +63,14 @@ from ezdxf.entities import (
     SplineEdge,
 )
 from .path import Path
-from .commands import Command
+from .commands import Command, PathElement
 from . import tools
-from .nesting import group_paths
+from .nesting import fast_bbox_detection, flatten_polygons
 
 __all__ = [
     "make_path",
     "to_lines",
+    "flattening_cache",
     "to_polylines3d",
     "to_lwpolylines",
     "to_polylines2d",
@@ -92,6 +97,12 @@ G1_TOL = 1e-4
 TPolygon = TypeVar("TPolygon", Hatch, MPolygon)
 BoundaryFactory = Callable[[BoundaryPaths, Path, int], None]
 
+# Command enums are singletons and can be compared by identity in loops:
+_LINE_TO = Command.LINE_TO
+_CURVE3_TO = Command.CURVE3_TO
+_CURVE4_TO = Command.CURVE4_TO
+_MOVE_TO = Command.MOVE_TO
+
 
 @singledispatch
 def make_path(entity, segments: int = 1, level: int = 4) -> Path:
@@ -111,6 +122,9 @@ def make_path(entity, segments: int = 1, level: int = 4) -> Path:
     # renders for each overloaded function a signature, which is ugly
     # and wrong signatures for multiple overloaded function
     # e.g. 3 equal signatures for type Solid.
+    # The factory functions are dispatched by the entity class and the
+    # dispatch result for each class is cached by functools.singledispatch,
+    # no DXF type strings are involved.
     raise TypeError(f"unsupported DXF type: {entity.dxftype()}")
 
 
@@ -189,6 +203,15 @@ def _from_arc(arc: Arc, **kwargs) -> "Path":
     path = Path()
     radius = abs(arc.dxf.radius)
     if radius > 1e-12:
+        start_angle = arc.dxf.start_angle
+        if (
+            segments <= 4
+            and arc.dxf.end_angle - start_angle == 360.0
+            and start_angle % 90.0 == 0.0
+            and arc.dxf.extrusion == Z_AXIS
+        ):
+            _add_full_circle(path, arc.dxf.center, radius, start_angle)
+            return path
         ellipse = ConstructionEllipse.from_arc(
             center=arc.dxf.center,
             radius=radius,
@@ -206,6 +229,9 @@ def _from_circle(circle: Circle, **kwargs) -> "Path":
     path = Path()
     radius = abs(circle.dxf.radius)
     if radius > 1e-12:
+        if segments <= 4 and circle.dxf.extrusion == Z_AXIS:
+            _add_full_circle(path, circle.dxf.center, radius, 0.0)
+            return path
         ellipse = ConstructionEllipse.from_arc(
             center=circle.dxf.center,
             radius=radius,
@@ -215,6 +241,37 @@ def _from_circle(circle: Circle, **kwargs) -> "Path":
     return path
 
 
+# Tangent length factor of a cubic Bézier curve for a quarter circle:
+_CIRCLE_CTRL_FACTOR = 0.5522847498307936  # 4/3 * tan(pi/8)
+
+
+def _add_full_circle(
+    path: Path, center: Vec3, radius: float, start_angle: float
+) -> None:
+    # Adds the same 4 clockwise oriented cubic Bézier curves as
+    # tools.add_ellipse() for a full circle in the WCS xy-plane, without the
+    # ConstructionEllipse and OCS overhead.
+    tangent_length = radius * _CIRCLE_CTRL_FACTOR
+    angle = math.radians(start_angle)
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    start = center + Vec3(cos_a * radius, sin_a * radius)
+    path.start = start
+    for _ in range(4):
+        # rotate by -90 deg, the 4th rotation returns exact to the start point
+        cos_b = sin_a
+        sin_b = -cos_a
+        end = center + Vec3(cos_b * radius, sin_b * radius)
+        path.curve4_to(
+            end,
+            start + Vec3(sin_a * tangent_length, -cos_a * tangent_length),
+            end - Vec3(sin_b * tangent_length, -cos_b * tangent_length),
+        )
+        start = end
+        cos_a = cos_b
+        sin_a = sin_b
+
+
 @make_path.register(Face3d)
 @make_path.register(Trace)
 @make_path.register(Solid)
@@ -498,6 +555,202 @@ def from_vertices(vertices: Iterable[UVec], close=False) -> Path:
     return path
 
 
+def _as_tuple(paths: Iterable[Path]) -> Sequence[Path]:
+    # Accepts a single path or an iterable of paths:
+    if isinstance(paths, Path):
+        return (paths,)
+    return tuple(paths)
+
+
+def _flatten(path: Path, distance: float, segments: int) -> Sequence[Vec3]:
+    """Returns the flattened `path` as sequence of vertices, walks the path
+    commands just once and collects all vertices into a single sequence.
+    """
+    if not path.has_curves:
+        # The control vertices of a path without curves are the same as the
+        # result of Path.flattening():
+        return path.control_vertices()
+    if distance == 0.0:
+        raise ValueError(f"invalid max distance: {distance}")
+    # The flattening is pure Python code and holds the GIL, distributing the
+    # paths of the converters to a thread pool would not speed up anything.
+    start = path.start
+    commands = path.commands()
+    cache = _flattening_cache  # read the global variable just once
+    if cache is None:
+        return _flatten_curves(start, commands, distance, segments)
+    return cache.flatten(start, commands, distance, segments)
+
+
+def _flatten_curves(
+    start: Vec3,
+    commands: Sequence[PathElement],
+    distance: float,
+    segments: int,
+) -> Tuple[Vec3, ...]:
+    points: List[Vec3] = [start]
+    add_vertex = points.append
+    add_vertices = points.extend
+    for cmd in commands:
+        end = cmd.end
+        cmd_type = cmd.type
+        if cmd_type is _CURVE3_TO:
+            add_vertices(
+                _flatten_quad_levien(
+                    start, cmd.ctrl, end, distance, segments  # type: ignore
+                )
+            )
+        elif cmd_type is _CURVE4_TO:
+            pts = iter(
+                Bezier4P(
+                    (start, cmd.ctrl1, cmd.ctrl2, end)  # type: ignore
+                ).flattening(distance, segments)
+            )
+            next(pts)  # skip first vertex
+            add_vertices(pts)
+        else:  # LINE_TO, MOVE_TO
+            add_vertex(end)
+        start = end
+    return tuple(points)
+
+
+class _FlatteningCache:
+    """LRU cache of flattened curved paths, limited by the count of the cached
+    vertices.
+    """
+
+    def __init__(self, max_vertices: int):
+        self.max_vertices = max_vertices
+        self.vertex_count = 0
+        # dicts preserve the insertion order, the first entry is the least
+        # recently used entry:
+        self._data: Dict[Tuple, Tuple[Vec3, ...]] = {}
+
+    def flatten(
+        self,
+        start: Vec3,
+        commands: Sequence[PathElement],
+        distance: float,
+        segments: int,
+    ) -> Tuple[Vec3, ...]:
+        # Paths are mutable and do not support weak references, therefore the
+        # path content is the cache key and not the path object:
+        key = (start, tuple(commands), distance, segments)
+        data = self._data
+        vertices = data.pop(key, None)
+        if vertices is None:
+            vertices = _flatten_curves(start, commands, distance, segments)
+            count = len(vertices)
+            if count > self.max_vertices:
+                return vertices
+            self.vertex_count += count
+            while self.vertex_count > self.max_vertices:
+                lru_key = next(iter(data))
+                self.vertex_count -= len(data.pop(lru_key))
+        data[key] = vertices
+        return vertices
+
+
+_flattening_cache: Optional[_FlatteningCache] = None
+
+
+@contextmanager
+def flattening_cache(max_vertices: int = 100_000) -> Iterator[None]:
+    """Context manager to reuse the flattened curves of paths which are
+    converted multiple times inside the context, e.g. by
+    :func:`to_lwpolylines` and :func:`to_hatches`. The cache holds up to
+    `max_vertices` flattened vertices and is discarded at the end of the
+    context. Nested contexts share the cache of the outermost context.
+
+    Only the converters of the :mod:`ezdxf.path` module are using the cache
+    and the flattening is done while iterating the results, so the results
+    have to be consumed inside the context::
+
+        with path.flattening_cache():
+            polylines = list(path.to_lwpolylines(paths))
+            hatches = list(path.to_hatches(paths))
+
+    .. versionadded:: 1.0
+
+    """
+    global _flattening_cache
+    if _flattening_cache is not None:
+        yield
+        return
+    _flattening_cache = _FlatteningCache(max_vertices)
+    try:
+        yield
+    finally:
+        _flattening_cache = None
+
+
+def _approx_parabola_integral(x: float) -> float:
+    d = 0.67
+    return x / (1.0 - d + math.sqrt(math.sqrt(d**4 + 0.25 * x * x)))
+
+
+def _approx_parabola_inv_integral(x: float) -> float:
+    b = 0.39
+    return x * (1.0 - b + math.sqrt(b * b + 0.25 * x * x))
+
+
+def _flatten_quad_levien(
+    p0: Vec3, p1: Vec3, p2: Vec3, distance: float, segments: int
+) -> List[Vec3]:
+    """Returns the flattened quadratic Bézier curve as list of vertices
+    without the start point `p0`.
+
+    The curve is mapped onto the parabola y=x², the vertices are evenly spaced
+    along the approximated arc length integral of this parabola, which yields
+    the (nearly) optimal count of vertices for the given max. `distance`.
+    Source: Raph Levien, "Flattening quadratic Béziers"
+
+    """
+    d01 = p1 - p0
+    d12 = p2 - p1
+    dd = d01 - d12
+    # The quadratic Bézier curve is always planar, the magnitude of the cross
+    # product replaces the 2D cross product:
+    d02 = p2 - p0
+    cross = d02.cross(dd).magnitude
+    dd_length = dd.magnitude
+    if cross < 1e-12 or dd_length < 1e-12:  # (nearly) a straight line
+        pts = iter(Bezier3P((p0, p1, p2)).flattening(distance, segments))
+        next(pts)  # skip first vertex
+        return list(pts)
+
+    x0 = d01.dot(dd) / cross
+    x2 = d12.dot(dd) / cross
+    scale = abs(cross / (dd_length * (x2 - x0)))
+    a0 = _approx_parabola_integral(x0)
+    a2 = _approx_parabola_integral(x2)
+    sqrt_tol = math.sqrt(distance)
+    if math.isfinite(scale):
+        da = abs(a2 - a0)
+        sqrt_scale = math.sqrt(scale)
+        if (x0 < 0.0) == (x2 < 0.0):
+            value = da * sqrt_scale
+        else:  # the cusp of the parabola is located inside the curve
+            x_min = sqrt_tol / sqrt_scale
+            value = sqrt_tol * da / _approx_parabola_integral(x_min)
+    else:
+        value = 0.0
+    count = max(int(math.ceil(0.5 * value / sqrt_tol)), segments, 1)
+
+    u0 = _approx_parabola_inv_integral(a0)
+    u2 = _approx_parabola_inv_integral(a2)
+    u_scale = 1.0 / (u2 - u0)
+    da = a2 - a0
+    points: List[Vec3] = []
+    for i in range(1, count):
+        u = _approx_parabola_inv_integral(a0 + da * i / count)
+        t = (u - u0) * u_scale
+        # relative to the start point to reduce floating point errors:
+        points.append(p0 + d01 * (2.0 * t * (1.0 - t)) + d02 * (t * t))
+    points.append(p2)  # exact end point
+    return points
+
+
 def to_lwpolylines(
     paths: Iterable[Path],
     *,
@@ -525,36 +778,78 @@ def to_lwpolylines(
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Quadratic Bézier curves are flattened by Raph Levien's method, the
+        vertices are spaced by the curvature and the result differs from
+        :meth:`Path.flattening`, for quadratic curves `segments` is the
+        minimum count of segments for the whole curve and not the count of
+        uniform subdivisions which are flattened further.
+
     """
-    if isinstance(paths, Path):
-        paths = [paths]
-    else:
-        paths = list(paths)
-    if len(paths) == 0:
+    paths = _as_tuple(paths)
+    if not paths:
         return []
 
-    extrusion = Vec3(extrusion)
-    reference_point = paths[0].start
     dxfattribs = dict(dxfattribs or {})
-    if not Z_AXIS.isclose(extrusion):
-        ocs, elevation = _get_ocs(extrusion, reference_point)
-        paths = tools.transform_paths_to_ocs(paths, ocs)
-        dxfattribs["elevation"] = elevation
-        dxfattribs["extrusion"] = extrusion
-    elif reference_point.z != 0:
-        dxfattribs["elevation"] = reference_point.z
+    paths = _transform_paths_to_ocs(paths, extrusion, dxfattribs, False)
 
     for path in tools.single_paths(paths):
         if len(path) > 0:
             p = LWPolyline.new(dxfattribs=dxfattribs)
-            p.append_points(path.flattening(distance, segments), format="xy")  # type: ignore
+            p.append_points(
+                [(v.x, v.y) for v in _flatten(path, distance, segments)],
+                format="xy",
+            )
             yield p
 
 
-def _get_ocs(extrusion: Vec3, reference_point: Vec3) -> Tuple[OCS, float]:
-    ocs = OCS(extrusion)
-    elevation = ocs.from_wcs(reference_point).z  # type: ignore
-    return ocs, elevation
+def _get_ocs(extrusion: Vec3) -> OCS:
+    """Returns a shared :class:`OCS` object for the normalized `extrusion`
+    vector.
+    """
+    return _get_ocs_cached(extrusion.xyz)
+
+
+@lru_cache(maxsize=64)
+def _get_ocs_cached(extrusion: Tuple[float, float, float]) -> OCS:
+    # The OCS objects are read-only for the converters and can be shared,
+    # mostly the same few extrusion vectors are used for all paths of an
+    # export:
+    return OCS(extrusion)
+
+
+def _transform_paths_to_ocs(
+    paths: Sequence[Path],
+    extrusion: UVec,
+    dxfattribs: Dict,
+    vec3_elevation: bool,
+) -> Sequence[Path]:
+    """Returns the `paths` transformed into the OCS defined by the `extrusion`
+    vector and sets the DXF attributes "elevation" and "extrusion" in
+    `dxfattribs`. The elevation is the distance from the WCS origin to the
+    start point of the first path, stored as Vec3(0, 0, elevation) if
+    `vec3_elevation` is ``True``.
+    """
+    reference_point = paths[0].start
+    # The default extrusion vector is the Z_AXIS object itself:
+    if extrusion is not Z_AXIS:
+        extrusion = Vec3(extrusion).normalize()
+        if not Z_AXIS.isclose(extrusion):
+            ocs = _get_ocs(extrusion)
+            elevation = ocs.from_wcs(reference_point).z  # type: ignore
+            paths = tools.transform_paths_to_ocs(paths, ocs)
+            dxfattribs["elevation"] = (
+                Vec3(0, 0, elevation) if vec3_elevation else elevation
+            )
+            dxfattribs["extrusion"] = extrusion
+            return paths
+    elevation = reference_point.z
+    if elevation != 0:
+        dxfattribs["elevation"] = (
+            Vec3(0, 0, elevation) if vec3_elevation else elevation
+        )
+    return paths
 
 
 def to_polylines2d(
@@ -584,29 +879,26 @@ def to_polylines2d(
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Quadratic Bézier curves are flattened by Raph Levien's method, the
+        vertices are spaced by the curvature and the result differs from
+        :meth:`Path.flattening`, for quadratic curves `segments` is the
+        minimum count of segments for the whole curve and not the count of
+        uniform subdivisions which are flattened further.
+
     """
-    if isinstance(paths, Path):
-        paths = [paths]
-    else:
-        paths = list(paths)
-    if len(paths) == 0:
+    paths = _as_tuple(paths)
+    if not paths:
         return []
 
-    extrusion = Vec3(extrusion)
-    reference_point = paths[0].start
     dxfattribs = dict(dxfattribs or {})
-    if not Z_AXIS.isclose(extrusion):
-        ocs, elevation = _get_ocs(extrusion, reference_point)
-        paths = tools.transform_paths_to_ocs(paths, ocs)
-        dxfattribs["elevation"] = Vec3(0, 0, elevation)
-        dxfattribs["extrusion"] = extrusion
-    elif reference_point.z != 0:
-        dxfattribs["elevation"] = Vec3(0, 0, reference_point.z)
+    paths = _transform_paths_to_ocs(paths, extrusion, dxfattribs, True)
 
     for path in tools.single_paths(paths):
         if len(path) > 0:
             p = Polyline.new(dxfattribs=dxfattribs)
-            p.append_vertices(path.flattening(distance, segments))
+            p.append_vertices(_flatten(path, distance, segments))
             yield p
 
 
@@ -643,6 +935,14 @@ def to_hatches(
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Quadratic Bézier curves are flattened by Raph Levien's method, the
+        vertices are spaced by the curvature and the result differs from
+        :meth:`Path.flattening`, for quadratic curves `segments` is the
+        minimum count of segments for the whole curve and not the count of
+        uniform subdivisions which are flattened further.
+
     """
     boundary_factory: BoundaryFactory
     if edge_path:
@@ -690,6 +990,14 @@ def to_mpolygons(
 
     .. versionadded:: 0.17
 
+    .. versionchanged:: 1.0
+
+        Quadratic Bézier curves are flattened by Raph Levien's method, the
+        vertices are spaced by the curvature and the result differs from
+        :meth:`Path.flattening`, for quadratic curves `segments` is the
+        minimum count of segments for the whole curve and not the count of
+        uniform subdivisions which are flattened further.
+
     """
     # noinspection PyTypeChecker
     boundary_factory: BoundaryFactory = partial(
@@ -727,7 +1035,9 @@ def build_edge_path(
                     prev = p
     else:  # Polyline boundary path
         boundaries.add_polyline_path(
-            Vec2.generate(path.flattening(distance, segments)), flags=flags
+            # (x, y)-tuples, the z-axis would be interpreted as bulge value!
+            [(v.x, v.y) for v in _flatten(path, distance, segments)],
+            flags=flags,
         )
 
 
@@ -739,8 +1049,8 @@ def build_poly_path(
     segments: int,
 ):
     boundaries.add_polyline_path(
-        # Vec2 removes the z-axis, which would be interpreted as bulge value!
-        Vec2.generate(path.flattening(distance, segments)),
+        # (x, y)-tuples, the z-axis would be interpreted as bulge value!
+        [(v.x, v.y) for v in _flatten(path, distance, segments)],
         flags=flags,
     )
 
@@ -752,41 +1062,38 @@ def _polygon_converter(
     extrusion: UVec = Z_AXIS,
     dxfattribs=None,
 ) -> Iterator[TPolygon]:
-    if isinstance(paths, Path):
-        paths = [paths]
-    else:
-        paths = list(paths)
-    if len(paths) == 0:
+    paths = _as_tuple(paths)
+    if not paths:
         return []
 
-    extrusion = Vec3(extrusion)
-    reference_point = paths[0].start
     _dxfattribs: Dict = dict(dxfattribs or {})
-    if not Z_AXIS.isclose(extrusion):
-        ocs, elevation = _get_ocs(extrusion, reference_point)
-        paths = tools.transform_paths_to_ocs(paths, ocs)
-        _dxfattribs["elevation"] = Vec3(0, 0, elevation)
-        _dxfattribs["extrusion"] = extrusion
-    elif reference_point.z != 0:
-        _dxfattribs["elevation"] = Vec3(0, 0, reference_point.z)
+    paths = _transform_paths_to_ocs(paths, extrusion, _dxfattribs, True)
     _dxfattribs.setdefault("solid_fill", 1)
     _dxfattribs.setdefault("pattern_name", "SOLID")
     _dxfattribs.setdefault("color", const.BYLAYER)
 
-    for group in group_paths(tools.single_paths(paths)):
-        if len(group) == 0:
-            continue
+    # The boundary paths of each polygon are added while traversing the
+    # nested polygon structure, the first path is the external boundary path:
+    for nested_polygon in fast_bbox_detection(tools.single_paths(paths)):
         polygon = cls.new(dxfattribs=_dxfattribs)
         boundaries = polygon.paths
-        external = group[0]
-        external.close()
-        add_boundary(boundaries, external, 1)
-        for hole in group[1:]:
-            hole.close()
-            add_boundary(boundaries, hole, 0)
+        flags = 1  # external
+        for path in flatten_polygons(nested_polygon):
+            add_boundary(boundaries, _closed_path(path), flags)
+            flags = 0  # hole
         yield polygon
 
 
+def _closed_path(path: Path) -> Path:
+    # Does not close the source path inplace, which could be a path object
+    # of the caller.
+    if path.is_closed:
+        return path
+    closed_path = path.clone()
+    closed_path.close()
+    return closed_path
+
+
 def to_polylines3d(
     paths: Iterable[Path],
     *,
@@ -808,16 +1115,23 @@ def to_polylines3d(
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Quadratic Bézier curves are flattened by Raph Levien's method, the
+        vertices are spaced by the curvature and the result differs from
+        :meth:`Path.flattening`, for quadratic curves `segments` is the
+        minimum count of segments for the whole curve and not the count of
+        uniform subdivisions which are flattened further.
+
     """
-    if isinstance(paths, Path):
-        paths = [paths]
+    paths = _as_tuple(paths)
 
     dxfattribs = dict(dxfattribs or {})
     dxfattribs["flags"] = const.POLYLINE_3D_POLYLINE
     for path in tools.single_paths(paths):
         if len(path) > 0:
             p = Polyline.new(dxfattribs=dxfattribs)
-            p.append_vertices(path.flattening(distance, segments))
+            p.append_vertices(_flatten(path, distance, segments))
             yield p
 
 
@@ -841,23 +1155,42 @@ def to_lines(
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Skips segments shorter than 1/10 of the flattening `distance`, the
+        last LINE always ends at the end point of the path.
+
+        Quadratic Bézier curves are flattened by Raph Levien's method, the
+        vertices are spaced by the curvature and the result differs from
+        :meth:`Path.flattening`, for quadratic curves `segments` is the
+        minimum count of segments for the whole curve and not the count of
+        uniform subdivisions which are flattened further.
+
     """
-    if isinstance(paths, Path):
-        paths = [paths]
+    paths = _as_tuple(paths)
     dxfattribs = dict(dxfattribs or {})
-    prev_vertex = None
+    # LINE segments shorter than 1/10 of the flattening distance are skipped:
+    min_length_square = (distance * 0.1) ** 2
     for path in tools.single_paths(paths):
         if len(path) == 0:
             continue
-        for vertex in path.flattening(distance, segments):
-            if prev_vertex is None:
-                prev_vertex = vertex
-                continue
+        vertices = _flatten(path, distance, segments)
+        points = [vertices[0]]
+        for vertex in vertices[1:]:
+            if (vertex - points[-1]).magnitude_square >= min_length_square:
+                points.append(vertex)
+        if len(points) == 1:
+            points.append(vertices[-1])
+        else:
+            # merge a short last segment into the previous LINE, the last
+            # LINE always ends at the end of the path:
+            points[-1] = vertices[-1]
+        prev_vertex = points[0]
+        for vertex in points[1:]:
             dxfattribs["start"] = prev_vertex
             dxfattribs["end"] = vertex
             yield Line.new(dxfattribs=dxfattribs)
             prev_vertex = vertex
-        prev_vertex = None
 
 
 PathParts = Union[BSpline, List[Vec3]]
@@ -880,7 +1213,6 @@ def to_bsplines_and_vertices(
     .. versionadded:: 0.16
 
     """
-    from ezdxf.math import bezier_to_bspline
 
     def to_vertices():
         points = [polyline[0][0]]
@@ -889,47 +1221,52 @@ def to_bsplines_and_vertices(
         return points
 
     def to_bspline():
-        b1 = bezier[0]
-        _g1_continuity_curves = [b1]
-        for b2 in bezier[1:]:
-            if have_bezier_curves_g1_continuity(b1, b2, g1_tol):
-                _g1_continuity_curves.append(b2)
+        cp1 = bezier[0]
+        _g1_continuity_curves = [cp1]
+        for cp2 in bezier[1:]:
+            if have_control_points_g1_continuity(cp1, cp2, g1_tol):
+                _g1_continuity_curves.append(cp2)
             else:
-                yield bezier_to_bspline(_g1_continuity_curves)
-                _g1_continuity_curves = [b2]
-            b1 = b2
+                yield control_points_to_bspline(_g1_continuity_curves)
+                _g1_continuity_curves = [cp2]
+            cp1 = cp2
 
         if _g1_continuity_curves:
-            yield bezier_to_bspline(_g1_continuity_curves)
+            yield control_points_to_bspline(_g1_continuity_curves)
 
-    curves = []
+    # The Bézier curves are stored as tuples of control points, the LINE
+    # segments as tuples of (start, end) vertices:
+    curves: List[Tuple[bool, Tuple[Vec3, ...]]] = []
     for path in tools.single_paths([path]):
         prev = path.start
-        for cmd in path:
-            if cmd.type == Command.CURVE3_TO:
-                curve = Bezier3P([prev, cmd.ctrl, cmd.end])  # type: ignore
-            elif cmd.type == Command.CURVE4_TO:
-                curve = Bezier4P([prev, cmd.ctrl1, cmd.ctrl2, cmd.end])  # type: ignore
-            elif cmd.type == Command.LINE_TO:
-                curve = (prev, cmd.end)
+        for cmd in path.commands():
+            end = cmd.end
+            cmd_type = cmd.type
+            if cmd_type is _CURVE3_TO:
+                curves.append((True, (prev, cmd.ctrl, end)))  # type: ignore
+            elif cmd_type is _CURVE4_TO:
+                curves.append(
+                    (True, (prev, cmd.ctrl1, cmd.ctrl2, end))  # type: ignore
+                )
+            elif cmd_type is _LINE_TO:
+                curves.append((False, (prev, end)))
             else:
                 raise ValueError
-            curves.append(curve)
-            prev = cmd.end
+            prev = end
 
     bezier: List = []
     polyline: List = []
-    for curve in curves:
-        if isinstance(curve, tuple):
-            if bezier:
-                yield from to_bspline()
-                bezier.clear()
-            polyline.append(curve)
-        else:
+    for is_curve, points in curves:
+        if is_curve:
             if polyline:
                 yield to_vertices()
                 polyline.clear()
-            bezier.append(curve)
+            bezier.append(points)
+        else:
+            if bezier:
+                yield from to_bspline()
+                bezier.clear()
+            polyline.append(points)
 
     if bezier:
         yield from to_bspline()
@@ -957,8 +1294,7 @@ def to_splines_and_polylines(
     .. versionadded:: 0.16
 
     """
-    if isinstance(paths, Path):
-        paths = [paths]
+    paths = _as_tuple(paths)
     dxfattribs = dict(dxfattribs or {})
 
     for path in tools.single_paths(paths):
@@ -1001,27 +1337,36 @@ def multi_path_from_matplotlib_path(mpath, curves=True) -> Path:
     """
     path = Path()
     current_polyline_start = Vec3()
+    # localize variables, iter_segments() yields the codes as int values, the
+    # conversion into MplCmd enums is not required:
+    moveto = int(MplCmd.MOVETO)
+    lineto = int(MplCmd.LINETO)
+    curve3 = int(MplCmd.CURVE3)
+    curve4 = int(MplCmd.CURVE4)
+    closepoly = int(MplCmd.CLOSEPOLY)
+    move_to = path.move_to
+    line_to = path.line_to
+    curve3_to = path.curve3_to
+    curve4_to = path.curve4_to
     for vertices, cmd in mpath.iter_segments(curves=curves):
-        cmd = MplCmd(cmd)
-        if cmd == MplCmd.MOVETO:
+        if cmd == lineto:
             # vertices = [x0, y0]
-            current_polyline_start = Vec3(vertices)
-            path.move_to(vertices)
-        elif cmd == MplCmd.LINETO:
-            # vertices = [x0, y0]
-            path.line_to(vertices)
-        elif cmd == MplCmd.CURVE3:
+            line_to(vertices)
+        elif cmd == curve3:
             # vertices = [x0, y0, x1, y1]
-            path.curve3_to(vertices[2:], vertices[0:2])
-        elif cmd == MplCmd.CURVE4:
+            curve3_to(vertices[2:], vertices[0:2])
+        elif cmd == curve4:
             # vertices = [x0, y0, x1, y1, x2, y2]
-            path.curve4_to(vertices[4:], vertices[0:2], vertices[2:4])
-        elif cmd == MplCmd.CLOSEPOLY:
+            curve4_to(vertices[4:], vertices[0:2], vertices[2:4])
+        elif cmd == moveto:
+            # vertices = [x0, y0]
+            current_polyline_start = Vec3(vertices)
+            move_to(vertices)
+        elif cmd == closepoly:
             # vertices = [0, 0]
             if not path.end.isclose(current_polyline_start):
-                path.line_to(current_polyline_start)
-        elif cmd == MplCmd.STOP:  # not used
-            pass
+                line_to(current_polyline_start)
+        # STOP command is not used
     return path
 
 
@@ -1059,42 +1404,52 @@ def to_matplotlib_path(paths: Iterable[Path], extrusion: UVec = Z_AXIS):
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Accepts also a single :class:`Path` object.
+
     """
+    import numpy as np
     from matplotlib.path import Path as MatplotlibPath
 
-    if not Z_AXIS.isclose(extrusion):
-        paths = tools.transform_paths_to_ocs(paths, OCS(extrusion))
-    else:
-        paths = list(paths)
-    if len(paths) == 0:
+    paths = _as_tuple(paths)
+    if not paths:
         raise ValueError("one or more paths required")
-
-    def add_command(code: MplCmd, point: Vec3):
-        codes.append(code)
-        vertices.append((point.x, point.y))
-
-    vertices: List[Tuple[float, float]] = []
-    codes: List[MplCmd] = []
-    for path in paths:
-        add_command(MplCmd.MOVETO, path.start)
+    if extrusion is not Z_AXIS:
+        extrusion = Vec3(extrusion).normalize()
+        if not Z_AXIS.isclose(extrusion):
+            paths = tools.transform_paths_to_ocs(paths, _get_ocs(extrusion))
+
+    # The control vertices of a path are the vertices of the Matplotlib path
+    # in the same order, the start point of an empty path is a MOVETO command:
+    path_vertices = [path.control_vertices() or [path.start] for path in paths]
+    count = sum(len(points) for points in path_vertices)
+    # Preallocated arrays of the required dtype are not copied by the
+    # Matplotlib Path() constructor:
+    vertices = np.empty((count, 2), dtype=np.float64)
+    codes = np.empty(count, dtype=np.uint8)
+    index = 0
+    for path, points in zip(paths, path_vertices):
+        end = index + len(points)
+        vertices[index:end] = [(v.x, v.y) for v in points]
+        path_codes = [MplCmd.MOVETO]
         for cmd in path.commands():
-            if cmd.type == Command.LINE_TO:
-                add_command(MplCmd.LINETO, cmd.end)
-            elif cmd.type == Command.MOVE_TO:
-                add_command(MplCmd.MOVETO, cmd.end)
-            elif cmd.type == Command.CURVE3_TO:
-                add_command(MplCmd.CURVE3, cmd.ctrl)  # type: ignore
-                add_command(MplCmd.CURVE3, cmd.end)
-            elif cmd.type == Command.CURVE4_TO:
-                add_command(MplCmd.CURVE4, cmd.ctrl1)  # type: ignore
-                add_command(MplCmd.CURVE4, cmd.ctrl2)  # type: ignore
-                add_command(MplCmd.CURVE4, cmd.end)
+            path_codes.extend(_MPL_CODES[cmd.type])
+        codes[index:end] = path_codes
+        index = end
 
     # STOP command is currently not required
-    assert len(vertices) == len(codes)
     return MatplotlibPath(vertices, codes)
 
 
+_MPL_CODES = {
+    Command.LINE_TO: (MplCmd.LINETO,),
+    Command.MOVE_TO: (MplCmd.MOVETO,),
+    Command.CURVE3_TO: (MplCmd.CURVE3, MplCmd.CURVE3),
+    Command.CURVE4_TO: (MplCmd.CURVE4, MplCmd.CURVE4, MplCmd.CURVE4),
+}
+
+
 # Interface to QtGui.QPainterPath
 
 
@@ -1167,29 +1522,47 @@ def to_qpainter_path(paths: Iterable[Path], extrusion: UVec = Z_AXIS):
 
     .. versionadded:: 0.16
 
+    .. versionchanged:: 1.0
+
+        Accepts also a single :class:`Path` object.
+
     """
-    from ezdxf.addons.xqt import QPainterPath, QPointF
+    from ezdxf.addons.xqt import QPainterPath, QPointF, QPolygonF
 
-    if not Z_AXIS.isclose(extrusion):
-        paths = tools.transform_paths_to_ocs(paths, OCS(extrusion))
-    else:
-        paths = list(paths)
-    if len(paths) == 0:
+    paths = _as_tuple(paths)
+    if not paths:
         raise ValueError("one or more paths required")
+    if extrusion is not Z_AXIS:
+        extrusion = Vec3(extrusion).normalize()
+        if not Z_AXIS.isclose(extrusion):
+            paths = tools.transform_paths_to_ocs(paths, _get_ocs(extrusion))
 
     def qpnt(v: Vec3):
         return QPointF(v.x, v.y)
 
     qpath = QPainterPath()
+    reserve = getattr(qpath, "reserve", None)  # requires Qt 5.13
+    if reserve is not None:
+        # Upper limit of the required path elements without copying the
+        # vertices: a MOVETO for the start point and at most 3 elements for
+        # each command, a quadratic curve is stored as cubic curve
+        reserve(sum(len(path) * 3 + 1 for path in paths))
     for path in paths:
+        if len(path) and not (path.has_curves or path.has_sub_paths):
+            # add all vertices of a polyline in one call:
+            qpath.addPolygon(
+                QPolygonF([QPointF(v.x, v.y) for v in path.control_vertices()])
+            )
+            continue
         qpath.moveTo(qpnt(path.start))
         for cmd in path.commands():
-            if cmd.type == Command.LINE_TO:
+            cmd_type = cmd.type
+            if cmd_type is _LINE_TO:
                 qpath.lineTo(qpnt(cmd.end))
-            elif cmd.type == Command.MOVE_TO:
+            elif cmd_type is _MOVE_TO:
                 qpath.moveTo(qpnt(cmd.end))
-            elif cmd.type == Command.CURVE3_TO:
+            elif cmd_type is _CURVE3_TO:
                 qpath.quadTo(qpnt(cmd.ctrl), qpnt(cmd.end))  # type: ignore
-            elif cmd.type == Command.CURVE4_TO:
+            elif cmd_type is _CURVE4_TO:
                 qpath.cubicTo(qpnt(cmd.ctrl1), qpnt(cmd.ctrl2), qpnt(cmd.end))  # type: ignore
     return qpath
@@ -92,7 +92,7 @@ WEIGHT_TO_VALUE = {
     "thin": 100,
     "hairline": 100,
     "extralight": 200,
-    "UltraLight": 200,
+    "ultralight": 200,
     "light": 300,
     "normal": 400,
     "medium": 500,
@@ -185,3 +185,8 @@ def test_find_font_file_by_family():
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+@pytest.mark.parametrize("name", ["ultralight", "UltraLight", "ULTRALIGHT"])
+def test_weight_names_are_case_insensitive(name):
+    assert fonts.weight_name_to_value(name) == 200
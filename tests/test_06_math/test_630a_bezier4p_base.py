@@ -87,6 +87,15 @@ def test_approximate(bezier):
     assert list(curve.approximate(2)) == [(0, 0), (0.5, 0.75), (1, 0)]
 
 
+@pytest.mark.parametrize("segments", [3, 10, 100])
+def test_approximate_matches_curve_points(bezier, segments):
+    curve = bezier(DEFPOINTS3D)
+    vertices = list(curve.approximate(segments))
+    expected = [curve.point(i / segments) for i in range(segments + 1)]
+    assert close_vectors(vertices, expected)
+    assert vertices[-1] == DEFPOINTS3D[-1]
+
+
 def test_reverse(bezier):
     curve = bezier(DEFPOINTS2D)
     vertices = list(curve.approximate(10))
@@ -183,6 +192,12 @@ def test_flattening_big_z_coordinates(bezier, z):
     assert len(points) > 0
 
 
+def test_flattening_of_invalid_curve_raises_recursion_error(bezier):
+    curve = bezier([(0, 0), (math.nan, 1), (2, -1), (3, 0)])
+    with pytest.raises(RecursionError):
+        list(curve.flattening(0.01))
+
+
 def test_pickle_support(bezier):
     curve = bezier(DEFPOINTS3D)
     pickled_curve = pickle.loads(pickle.dumps(curve))
@@ -12,6 +12,9 @@ from ezdxf.math import (
     Bezier4P,
     have_bezier_curves_g1_continuity,
     bezier_to_bspline,
+    control_points_to_bspline,
+    quadratic_to_cubic_control_points,
+    have_control_points_g1_continuity,
     split_bezier,
     quadratic_bezier_from_3p,
     close_vectors,
@@ -99,6 +102,28 @@ def test_g1_continuity_for_degenerated_bezier_curves():
     assert have_bezier_curves_g1_continuity(D1, D2) is False
 
 
+def test_g1_continuity_for_control_points():
+    cp1 = B1.control_points
+    assert have_control_points_g1_continuity(cp1, B2.control_points) is True
+    assert have_control_points_g1_continuity(cp1, B3.control_points) is False
+    assert have_control_points_g1_continuity(cp1, D2.control_points) is False
+
+
+def test_quadratic_to_cubic_control_points():
+    quadratic = Bezier3P([(0, 0), (1, 2), (3, 0)])
+    cubic = quadratic_to_cubic_bezier(quadratic)
+    points = quadratic_to_cubic_control_points(quadratic.control_points)
+    assert close_vectors(points, cubic.control_points)
+
+
+def test_control_points_to_bspline():
+    curves = [B1, Bezier3P([(3, 0), (4, -1), (6, 0)])]
+    bspline = control_points_to_bspline(c.control_points for c in curves)
+    expected = bezier_to_bspline(curves)
+    assert close_vectors(bspline.control_points, expected.control_points)
+    assert bspline.knots() == expected.knots()
+
+
 @pytest.mark.parametrize("curve", [D1, D2])
 def test_flatten_degenerated_bezier_curves(curve):
     # Degenerated Bezier curves behave like regular curves!
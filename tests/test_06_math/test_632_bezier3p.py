@@ -2,6 +2,7 @@
 #  License: MIT License
 import pytest
 import pickle
+import math
 from ezdxf.math import Vec3, Vec2, Matrix44, close_vectors
 
 # Import from 'ezdxf.math._bezier3p' to test Python implementation
@@ -117,6 +118,12 @@ def test_flattening_big_z_coordinates(bezier, z):
     assert len(points) > 0
 
 
+def test_flattening_of_invalid_curve_raises_recursion_error(bezier):
+    curve = bezier([(0, 0), (math.nan, 1), (2, 0)])
+    with pytest.raises(RecursionError):
+        list(curve.flattening(0.01))
+
+
 def test_approximated_length(bezier):
     length = bezier(DEFPOINTS3D).approximated_length(64)
     assert length == pytest.approx(127.12269127455725)
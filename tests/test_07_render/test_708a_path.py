@@ -18,6 +18,7 @@ from ezdxf.math import (
     Bezier3P,
     close_vectors,
     OCS,
+    ConstructionEllipse,
 )
 from ezdxf.entities import (
     factory,
@@ -412,6 +413,23 @@ def test_from_circle(radius):
     assert path.is_closed is True
 
 
+def test_full_circle_matches_ellipse_approximation():
+    circle = factory.new(
+        "CIRCLE",
+        dxfattribs={
+            "center": (1, 2, 3),
+            "radius": 2.5,
+        },
+    )
+    expected = Path()
+    tools.add_ellipse(
+        expected, ConstructionEllipse.from_arc(center=(1, 2, 3), radius=2.5)
+    )
+    path = make_path(circle)
+    assert len(path) == 4
+    assert close_vectors(path.control_vertices(), expected.control_vertices())
+
+
 def test_from_circle_with_zero_radius():
     circle = factory.new(
         "CIRCLE",
@@ -3,7 +3,7 @@
 import pytest
 import math
 from ezdxf.layouts import VirtualLayout
-from ezdxf.math import Matrix44, OCS, Vec3, close_vectors
+from ezdxf.math import Matrix44, OCS, Vec3, Bezier3P, close_vectors
 from ezdxf.path import (
     Path,
     bbox,
@@ -13,6 +13,7 @@ from ezdxf.path import (
     transform_paths_to_ocs,
     to_polylines3d,
     to_lines,
+    flattening_cache,
     to_lwpolylines,
     to_polylines2d,
     to_hatches,
@@ -398,6 +399,47 @@ class TestToEntityConverter:
         assert l0.dxf.start == (0, 0, 0)
         assert l0.dxf.end == (4, 0, 0)
 
+    def test_to_lines_skips_zero_length_segments(self):
+        p = Path()
+        p.line_to((1, 0))
+        p.line_to((1, 0))
+        p.line_to((2, 0))
+        lines = list(to_lines(p))
+        assert len(lines) == 2
+        assert lines[1].dxf.start == (1, 0)
+        assert lines[1].dxf.end == (2, 0)
+
+    def test_to_lines_ends_at_the_end_of_a_closed_path(self):
+        p = from_vertices(
+            [(0, 0), (5, 0), (5, 5), (0, 5), (0, 0.0005)], close=True
+        )
+        lines = list(to_lines(p))
+        assert len(lines) == 4
+        assert lines[-1].dxf.start == (0, 5)
+        assert lines[-1].dxf.end == (0, 0)
+
+    def test_flattening_of_modified_path(self, path):
+        count = len(list(to_polylines3d(path))[0])
+        path.curve3_to((8, 0, 0), (6, 2, 0))
+        assert len(list(to_polylines3d(path))[0]) > count
+
+    def test_flattening_cache(self, path):
+        expected = list(to_polylines3d(path))[0].vertices
+        with flattening_cache():
+            p1 = list(to_polylines3d(path))[0]
+            p2 = list(to_polylines3d(path))[0]
+            path.curve3_to((8, 0, 0), (6, 2, 0))
+            p3 = list(to_polylines3d(path))[0]
+        assert [v.dxf.location for v in p1.vertices] == [
+            v.dxf.location for v in expected
+        ]
+        assert len(p2) == len(p1)
+        assert len(p3) > len(p1), "modified path should not use cached data"
+
+    def test_flattening_cache_with_limited_size(self, path):
+        with flattening_cache(max_vertices=2):
+            assert len(list(to_polylines3d(path))[0]) > 2
+
     def test_empty_to_lwpolyline(self):
         assert list(to_lwpolylines([])) == []
 
@@ -440,6 +482,15 @@ class TestToEntityConverter:
             is True
         )
 
+    def test_to_lwpolylines_with_tiny_unnormalized_extrusion(self, path1):
+        m = Matrix44.x_rotate(math.pi / 6)
+        path = path1.transform(m)
+        extrusion = m.transform((0, 0, 1))
+        p0 = list(to_lwpolylines(path, extrusion=extrusion * 1e-9))[0]
+        assert p0.dxf.elevation == pytest.approx(1)
+        assert p0.dxf.extrusion.isclose(extrusion)
+        assert p0[-1][:2] == pytest.approx((4, 0))
+
     def test_multi_path_to_lwpolylines(self):
         path = Path()
         path.line_to((1, 0, 0))
@@ -488,6 +539,12 @@ class TestToEntityConverter:
         assert h0.dxftype() == "HATCH"
         assert len(h0.paths) == 1
 
+    def test_to_hatches_does_not_close_source_paths(self, path1):
+        assert path1.is_closed is False
+        hatches = list(to_hatches(path1, edge_path=False))
+        assert len(hatches[0].paths) == 1
+        assert path1.is_closed is False
+
     def test_to_poly_path_hatches_with_wcs_elevation(self, path1):
         hatches = list(to_hatches(path1, edge_path=False))
         ho = hatches[0]
@@ -562,6 +619,29 @@ class TestToEntityConverter:
         assert mp.dxf.color == 6
         assert mp.dxf.fill_color == 1
 
+    def test_flattened_quadratic_curve_vertices_are_located_on_the_curve(
+        self,
+    ):
+        p = Path((0, 0, 1))
+        p.curve3_to((10, 0, 1), (5, 8, 1))
+        curve = Bezier3P([(0, 0, 1), (5, 8, 1), (10, 0, 1)])
+        polyline = list(to_polylines3d(p, segments=4))[0]
+        vertices = list(polyline.points())
+        assert len(vertices) > 4
+        assert vertices[0] == (0, 0, 1)
+        assert vertices[-1] == (10, 0, 1)
+        approx = list(curve.approximate(1000))
+        for v in vertices:
+            assert min(v.distance(c) for c in approx) < 0.05
+
+    def test_flattening_a_straight_quadratic_curve(self):
+        p = Path()
+        p.curve3_to((10, 0), (5, 0))
+        polyline = list(to_polylines3d(p, segments=4))[0]
+        vertices = list(polyline.points())
+        assert len(vertices) == 5
+        assert vertices[-1] == (10, 0)
+
 
 # Issue #224 regression test
 @pytest.fixture